@@ -1,66 +1,54 @@
+import io
+import re
 import streamlit as st
 import pandas as pd
 import requests
 import plotly.express as px
 from wordcloud import WordCloud
 
+# We parse the Excel file with calamine when available, as it is much faster than openpyxl
+try:
+    import python_calamine  # noqa: F401
+    EXCEL_ENGINE = "calamine"
+except ImportError:
+    EXCEL_ENGINE = "openpyxl"
+
 #####################
 # DATA PREPARATION  #
 #####################
 
-# We load the data from the API
-url = "https://www.data.gouv.fr/api/1/datasets/films-ayant-realise-plus-dun-million-dentrees/"
-response = requests.get(url)
-data = response.json()
-df_dict = pd.read_excel(data["resources"][0]["extras"]["check:url"], sheet_name=None, skiprows=5,
-                        header=1)
-
-# For some sheets,we have to explicitly rename the ranking column
-for sheet_name, df in df_dict.items():
-    if "Unnamed: 0" in df.columns:
-        df.rename(columns={df.columns[0]: "rang"}, inplace=True)
+# Columns of the Excel sheets that are used in the analysis
+USED_COLUMNS = {"titre", "entrées (millions)", "nationalité", "sortie"}
 
-# We drop useless sheets, and concatenate all the remaining ones
-df_dict.pop("Sommaire")
-df_dict.pop("ESRI_MAPINFO_SHEET")
-df = pd.concat(df_dict.values(), ignore_index=True)
+# Sheets of the Excel file that do not contain movies
+USELESS_SHEETS = {"Sommaire", "ESRI_MAPINFO_SHEET"}
 
-# We convert "sortie" to datetime and without the hour
-df["sortie"] = pd.to_datetime(df["sortie"], format="%d/%m/%Y")
-
-# ENCODING OF NATIONALITIES
-# We convert all nationalities to uppercase
-df["nationalité"] = df["nationalité"].str.upper()
+# Themes looked for in the titles of the movies of each decade
+THEMES = {
+    "2000s": ["SECRET", "JOUR", "VIE", "MONDE", "CHAPITRE"],
+    "2010s": ["MONDE", "AVENTURE", "VOYAGE", "DERNIER", "SECR", "CHAPITRE"],
+    "2020s": ["BLACK", "ANIMAUX", "FANTASTIQUE", "VOYAGE", "JOUR"]
+}
 
-# We map all nationalities to a code
+# We map all nationalities to a code (nationalities already written as a code are kept as is)
 nationality_mapping = {
     'ETATS UNIS': 'US',
     'USA': 'US',
-    'US': 'US',
 
     'GRANDE BRETAGNE': 'GB',
-    'GB': 'GB',
     'FRANCE': 'FR',
-    'FR': 'FR',
 
     'CANADA': 'CA',
-    'CA': 'CA',
     'AUSTRALIE': 'AU',
-    'AU': 'AU',
     'COREE DU SUD': 'KS',
-    'KS': 'KS',
 
     'ITALIE': 'IT',
-    'IT': 'IT',
     'MAROC': 'MA',
     'NOUVELLE ZELANDE': 'NZ',
     'ALLEMAGNE': 'DE',
-    'DE': 'DE',
     'BELGIQUE': 'BE',
-    'BE': 'BE',
 
     'LUXEMBOURG': 'LUX',
-    'LUX': 'LUX',
     'REPUBLIQUE TCHEQUE': 'CZ',
     'HONGRIE': 'HU',
     'ESPAGNE': 'ES',
@@ -71,95 +59,155 @@ nationality_mapping = {
 }
 
 
-# We apply the mapping to encode the nationalities
-def encode_nationality(value):
-    # Split values by '/' and map each component
-    countries = value.split('/')
-    countries = [nationality_mapping.get(country.strip(), country) for country in countries]
-    return ' / '.join(countries)
+# We load and prepare all the dataframes only once, and keep them in Streamlit's cache:
+# the API call, the Excel parsing and the groupbys are not re-run at each interaction with the app
+@st.cache_data(ttl=24 * 3600)
+def load_and_prepare():
+    # We load the data from the API
+    url = "https://www.data.gouv.fr/api/1/datasets/films-ayant-realise-plus-dun-million-dentrees/"
+
+    # Both requests go through the same session (keep-alive), and the Excel file is downloaded once in memory
+    with requests.Session() as session:
+        data = session.get(url, timeout=10).json()
+        response = session.get(data["resources"][0]["extras"]["check:url"], timeout=30)
+
+    # We open the workbook once, and parse all its sheets except the useless ones.
+    # We only parse the columns we need (the ranking column is not used: movies are ranked by sorting on the entries)
+    with pd.ExcelFile(io.BytesIO(response.content), engine=EXCEL_ENGINE) as excel_file:
+        sheets = [excel_file.parse(sheet_name, skiprows=5, header=1, usecols=lambda column: column in USED_COLUMNS)
+                  for sheet_name in excel_file.sheet_names if sheet_name not in USELESS_SHEETS]
+
+    # We concatenate all the non-empty sheets
+    df = pd.concat([sheet for sheet in sheets if not sheet.empty], ignore_index=True)
 
+    # We convert "sortie" to datetime and without the hour
+    df["sortie"] = pd.to_datetime(df["sortie"], format="%d/%m/%Y")
 
-# We replace all nationalities
-df['nationalité'] = df['nationalité'].apply(encode_nationality)
+    # ENCODING OF NATIONALITIES
+    # We convert all nationalities to uppercase
+    df["nationalité"] = df["nationalité"].str.upper()
 
-# We rename the entrées column
-df.rename(columns={"entrées (millions)": "entrées"}, inplace=True)
+    # We replace all nationalities: co-productions are split by '/', each country is mapped to its code
+    # (or kept as is if it has no code), and the codes are joined back for each movie
+    countries = df['nationalité'].str.split('/').explode().str.strip()
+    codes = countries.map(nationality_mapping).where(lambda x: x.notna(), countries)
+    df['nationalité'] = codes.groupby(level=0, sort=False).agg(' / '.join)
 
-# We copy the dataframe to keep the original one and present it in the home page
-df_original = df.copy()
+    # There are only a few distinct nationalities, so we store them as categories (lighter, and faster to group by)
+    df['nationalité'] = df['nationalité'].astype("category")
 
-# We now need to work on duplicate movies
-# Indeed, some successful movies, released by the end of the year, are featured twice in the dataset:
-# one time in the year of release, and one time in the following year.
-# For example, Avatar was released in December 2009, so it has performed both in 2009 and 2010.
-# As such, I have decided to consider this type of movie only in its year of release, but with its cumulated entries.
+    # We rename the entrées column
+    df.rename(columns={"entrées (millions)": "entrées"}, inplace=True)
 
-# To do so, we group the dataframe by title and sum the entries
-df = df.groupby("titre").agg({"entrées": "sum", "nationalité": "first", 'sortie': "first"}) \
-    .sort_values(by="entrées", ascending=False).reset_index()
+    # We now need to work on duplicate movies
+    # Indeed, some successful movies, released by the end of the year, are featured twice in the dataset:
+    # one time in the year of release, and one time in the following year.
+    # For example, Avatar was released in December 2009, so it has performed both in 2009 and 2010.
+    # As such, I have decided to consider this type of movie only in its year of release, but with its cumulated entries.
 
+    # To do so, we group the dataframe by title and sum the entries
+    # (the titles do not need to be sorted, as the movies are then sorted by entries)
+    df = df.groupby("titre", sort=False).agg({"entrées": "sum", "nationalité": "first", 'sortie': "first"}) \
+        .sort_values(by="entrées", ascending=False).reset_index()
 
-###########################################################################################################
+    # We extract the year of release once, as a compact integer series, for the decade split and the yearly counts
+    # (it is not added as a column, so that the displayed dataframes are unchanged, and it is nullable, so that
+    # movies without a release date are skipped as before instead of failing the cast)
+    years = df["sortie"].dt.year.astype("Int16")
 
+    # PREPARATION OF EACH PERIOD DATAFRAME
+    # As the dataframe already has one row per movie, sorted by entries, we only have to split it by decade of release:
+    # a single groupby pass is enough, and each decade keeps the ranking by number of entries
+    decades = {decade: df_decade.reset_index(drop=True)
+               for decade, df_decade in df.groupby(years // 10 * 10, sort=False)}
+    df_2000s = decades[2000]
+    df_2010s = decades[2010]
+    df_2020s = decades[2020]
 
-########################################
-# PREPARATION OF EACH PERIOD DATAFRAME #
-########################################
+    # We count the number of movies released each year, so that the pages only have to slice it
+    year_counts = years.value_counts().sort_index()
 
-# 2000s DataFrame
-df_2000s = df[df["sortie"].dt.year.between(2000, 2009)].groupby("titre").agg(
-    {"entrées": "sum", "nationalité": "first", 'sortie': "first"}) \
-    .sort_values(by="entrées", ascending=False).reset_index()
+    # We count the number of movies of each decade
+    decade_counts = pd.Series({"2000s": len(df_2000s), "2010s": len(df_2010s), "2020s": len(df_2020s)},
+                              name="Number of movies")
 
-# 2010s DataFrame
-df_2010s = df[df["sortie"].dt.year.between(2010, 2019)].groupby("titre").agg(
-    {"entrées": "sum", "nationalité": "first", 'sortie': "first"}) \
-    .sort_values(by="entrées", ascending=False).reset_index()
+    periods = {"ALL TIME": df, "2000s": df_2000s, "2010s": df_2010s, "2020s": df_2020s}
 
-# 2020s DataFrame
-df_2020s = df[df["sortie"].dt.year.between(2020, pd.to_datetime("now").year)].groupby("titre").agg(
-    {"entrées": "sum", "nationalité": "first", 'sortie': "first"}) \
-    .sort_values(by="entrées", ascending=False).reset_index()
+    # We compute the 10 nationalities with the most entries for each period
+    top_10_nat = {period: data.groupby("nationalité", observed=True, sort=False)["entrées"].sum().nlargest(10)
+                  for period, data in periods.items()}
+
+    # We look for the themes of each decade in the titles once, as plain substrings (no regex needed)
+    themes = {period: {theme: periods[period]["titre"].str.contains(theme, regex=False, na=False)
+                       for theme in period_themes}
+              for period, period_themes in THEMES.items()}
+
+    return df, df_2000s, df_2010s, df_2020s, year_counts, decade_counts, top_10_nat, themes
 
 
 ##########################
 # VISUALIZATION FUNCTIONS
 ##########################
 
-def plot_all_movies(data, title):
+# Articles and most common words removed from the titles of the word cloud, in a single regex pass
+# (word boundaries avoid stripping these words from inside other words, e.g. "LES" in "BLEUES")
+WORD_CLOUD_STOP_WORDS = re.compile(r"\(LES\)|\(LE\) |\(LA\) |\bL'|\b(?:LES|LE|LA|DU|DES|DE|AU|UN)\b|\bET ")
+
+
+# Each figure is built by a cached function, so that a rerun of the app (navigation, widget interaction)
+# reuses the already built figure instead of recomputing it
+# (the top movies slider creates one entry per value, so we bound the number of cached figures)
+@st.cache_data(max_entries=20)
+def build_all_movies_fig(data, title):
     fig = px.bar(data, x="titre", y="entrées", title=title)
     fig.update_layout(
         width=1200,
         height=800,
         xaxis_title="Movie",
         yaxis_title="Entries")
-    st.plotly_chart(fig)
+    return fig
 
 
-def plot_entrees_evolution(data, title):
-    fig = px.histogram(data, x="sortie", y="entrées", title=title)
+def plot_all_movies(data, title):
+    st.plotly_chart(build_all_movies_fig(data, title))
+
+
+# The slider of the top movies only reruns this fragment, not the whole page
+@st.fragment
+def plot_top_movies(data, title):
+    # With around a thousand movies, we only plot the top ones to keep the chart responsive
+    top_n = st.slider("Number of movies to plot (ranked by entries):", 50, data.shape[0], 200)
+    plot_all_movies(data.head(top_n), title)
+
+
+@st.cache_data
+def build_entrees_evolution_fig(data, title):
+    # We sum the entries per semester of release, so that only the aggregated bars are sent to the browser
+    semesters = pd.to_datetime(pd.DataFrame({"year": data["sortie"].dt.year,
+                                             "month": (data["sortie"].dt.month - 1) // 6 * 6 + 1,
+                                             "day": 1}))
+    entrees = data.groupby(semesters.rename("sortie"))["entrées"].sum().reset_index()
+
+    fig = px.bar(entrees, x="sortie", y="entrées", title=title)
     fig.update_layout(
         width=1200,
         height=800,
         xaxis_title="Year",
         yaxis_title="Entries")
-    fig.update_traces(marker=dict(line=dict(color='black', width=1.5)))
-    st.plotly_chart(fig)
+    # Each bar is keyed on the first day of its semester, so we make it span the whole semester
+    fig.update_traces(marker=dict(line=dict(color='black', width=1.5)),
+                      xperiod="M6", xperiod0="2000-01-01", xperiodalignment="middle")
+    return fig
+
 
+def plot_entrees_evolution(data, title):
+    st.plotly_chart(build_entrees_evolution_fig(data, title))
 
-def plot_nb_movies_evolution(data, decade, title):
-    # We first count the number of movies released in a specific decade
-    if decade == "all-time":
-        nb_movies = data["sortie"].dt.year.value_counts().sort_index()
-    elif decade == 2020:
-        nb_movies = data["sortie"][data["sortie"].dt.year.between(decade, pd.to_datetime("now").year)] \
-            .dt.year.value_counts().sort_index()
-    else:
-        nb_movies = data["sortie"][
-            data["sortie"].dt.year.between(decade, decade + 9)].dt.year.value_counts().sort_index()
 
+@st.cache_data
+def build_nb_movies_evolution_fig(year_counts, title):
     # We plot the histogram of the number of released movies in the decade
-    fig = px.bar(nb_movies, x=nb_movies.index, y=nb_movies.values,
+    fig = px.bar(year_counts, x=year_counts.index, y=year_counts.values,
                  title=title)
     fig.update_layout(
         width=1200,
@@ -167,32 +215,43 @@ def plot_nb_movies_evolution(data, decade, title):
         xaxis_title="Year",
         yaxis_title="Number of movies")
     fig.update_traces(marker=dict(line=dict(color='black', width=1.5)))
-    st.plotly_chart(fig)
+    return fig
+
 
+def plot_nb_movies_evolution(year_counts, title):
+    st.plotly_chart(build_nb_movies_evolution_fig(year_counts, title))
 
-def plot_nationalites_distribution(data, title):
-    # We want to display the 10 highest distribution of nationalities
-    top_10_nat = data.groupby("nationalité").agg({"entrées": "sum"}).sort_values(by="entrées", ascending=False).head(10)
 
-    # We plot the pie chart
-    fig = px.pie(top_10_nat, values="entrées", names=top_10_nat.index, title=title)
+@st.cache_data
+def build_nationalites_distribution_fig(top_10_nat, title):
+    # We plot the pie chart of the 10 highest distribution of nationalities
+    fig = px.pie(values=top_10_nat.values, names=top_10_nat.index, title=title)
     fig.update_traces(textposition='inside', textinfo='percent+label')
     fig.update_layout(
         width=1200,
         height=800)
-    st.plotly_chart(fig)
+    return fig
+
+
+def plot_nationalites_distribution(top_10_nat, title):
+    st.plotly_chart(build_nationalites_distribution_fig(top_10_nat, title))
+
+
+# The word cloud layout is slow, so we cache the rendered PNG, keyed by the joined titles rather than the dataframe
+@st.cache_data
+def build_word_cloud_png(titles):
+    wordcloud = WordCloud(width=600, height=400, background_color='white', min_font_size=10).generate(titles)
+    buffer = io.BytesIO()
+    wordcloud.to_image().save(buffer, format="PNG")
+    return buffer.getvalue()
 
 
 def plot_movies_word_cloud(data):
     # We remove the articles and the most common words
-    movies = data["titre"].str.replace("(LES)", "").str.replace("(LE) ", "").str.replace("(LA) ", ""). \
-        str.replace("LES", "").str.replace("DU", "").str.replace("DE", "").str.replace("DES", "").str.replace("LE", "") \
-        .str.replace("LA", "").str.replace("L'", "").str.replace("AU", "").str.replace("UN", "").str.replace("ET ","").str.strip()
+    movies = data["titre"].str.replace(WORD_CLOUD_STOP_WORDS, "", regex=True).str.strip()
 
     # We create the word cloud
-    wordcloud = WordCloud(width=600, height=400, background_color='white', min_font_size=10).generate(
-        ' '.join(movies))
-    st.image(wordcloud.to_image())
+    st.image(build_word_cloud_png(' '.join(movies)))
 
 
 #################################################################################################################
@@ -205,6 +264,8 @@ def plot_movies_word_cloud(data):
 
 st.set_page_config(layout="wide")
 
+df, df_2000s, df_2010s, df_2020s, year_counts, decade_counts, top_10_nat, themes = load_and_prepare()
+
 st.sidebar.title("MENU NAVIGATION")
 page = st.sidebar.selectbox(
     "Choose a period :",
@@ -239,12 +300,12 @@ if page == "HOME":
      The studied dataset consists of movies that have made more than 1 million entries in France **each year 
      from today to 2003**, and ranked in **order of entries**:
     """)
-    st.write(df)
+    st.dataframe(df, height=400)
 
     st.markdown("""
     _N.B. : Note that this dataset also contains three millionaire movies released before 2003:_
     """)
-    st.write(df[df["sortie"] < pd.to_datetime("2003")])
+    st.dataframe(df[df["sortie"] < "2003"])
 
     st.markdown("""
     #### Through the analysis, we will call movies that have made more than 1M entries in France under the term of *"millionaire movies"*.
@@ -263,19 +324,19 @@ if page == "ALL TIME":
     st.toast("All Time Movies !", icon="🍿")
     st.title("All Time Millionaire Movies in France")
     st.write("A dataset of {} movies, ranked by number of entries: ".format(df.shape[0]))
-    st.write(df)
+    st.dataframe(df, height=400)
 
     st.header("We plot all these movies.")
     st.subheader("You can interact with the graph to focus on a specific region.")
 
     # ALL TIME PLOT
-    plot_all_movies(df, "All Time Millionaire Movies in France")
+    plot_top_movies(df, "All Time Millionaire Movies in France")
 
 
     # EVOLUTION OF ENTRIES THROUGH THE YEARS
     st.markdown("""----------------------------------""")
     st.header("How does the number of entries evolve through the 21st century?")
-    st.bar_chart(df["sortie"].dt.year.value_counts().sort_index())
+    st.bar_chart(year_counts)
 
     st.markdown("""
     The years 2009, 2011, 2014, 2017 and 2018 have known the best entries in France **(+120M !)**.
@@ -285,7 +346,7 @@ if page == "ALL TIME":
 
     # NUMBER OF MOVIES PER YEAR
     st.header("How many millionaire movies are released each year?")
-    plot_nb_movies_evolution(df, "all-time", "Number of movies that have made more than 1 million entries per year")
+    plot_nb_movies_evolution(year_counts, "Number of movies that have made more than 1 million entries per year")
 
     st.markdown("""
     We can notice that **the number of millionaire movies per year influence the number of entries**: 
@@ -296,9 +357,7 @@ if page == "ALL TIME":
 
     # NUMBER OF MILLIONAIRE MOVIES PER DECADE
     st.header("And how many per decade?")
-    nb_decade_movies = pd.DataFrame([df_2000s.shape[0], df_2010s.shape[0], df_2020s.shape[0]],
-                                    index=["2000s", "2010s", "2020s"], columns=["Number of movies"])
-    st.bar_chart(nb_decade_movies)
+    st.bar_chart(decade_counts)
 
     st.markdown("""
     The most exciting years in terms of quantity of millionaire movies are **the 2010s** with **{} movies**!
@@ -312,7 +371,7 @@ if page == "ALL TIME":
     # NATIONALITIES OF MILLIONAIRE MOVIES
     st.markdown("""----------------------------------""")
     st.header("What are the countries' films that have made the most entries in France?")
-    plot_nationalites_distribution(df, "Nationalities of All Time Millionaire Movies")
+    plot_nationalites_distribution(top_10_nat["ALL TIME"], "Nationalities of All Time Millionaire Movies")
 
     st.markdown("""
     The United States cumulate more than **a billion entries** in France through the 21st century. :exploding_head:
@@ -332,7 +391,7 @@ if page == "2000s":
     st.toast("2000s Movies !", icon="🍿")
     st.title("2000's Millionaire Movies in France")
     st.write("A dataset of {} movies, ranked by number of entries: ".format(df_2000s.shape[0]))
-    st.write(df_2000s)
+    st.dataframe(df_2000s, height=400)
 
     st.header("We plot all these movies.")
     st.subheader("You can interact with the graph to focus on a specific region.")
@@ -349,7 +408,7 @@ if page == "2000s":
     with col1:
         plot_entrees_evolution(df_2000s, "Evolution of the entries through the years in the 2000s")
     with col2:
-        plot_nb_movies_evolution(df_2000s, 2000,
+        plot_nb_movies_evolution(year_counts.loc[2000:2009],
                                  "Number of movies that have made more than 1 million entries per year in the 2000s")
 
     st.markdown("""
@@ -363,14 +422,14 @@ if page == "2000s":
 
     col1, col2, col3 = st.columns(3)
     with col1:
-        st.write(
-            df[(df["sortie"] >= pd.to_datetime("2003-12-01")) & (df["sortie"] <= pd.to_datetime("2004-06-30"))].head(3))
+        st.dataframe(
+            df[df["sortie"].between("2003-12-01", "2004-06-30")].head(3))
     with col2:
-        st.write(
-            df[(df["sortie"] >= pd.to_datetime("2005-12-01")) & (df["sortie"] <= pd.to_datetime("2006-06-30"))].head(3))
+        st.dataframe(
+            df[df["sortie"].between("2005-12-01", "2006-06-30")].head(3))
     with col3:
-        st.write(
-            df[(df["sortie"] >= pd.to_datetime("2009-06-01")) & (df["sortie"] <= pd.to_datetime("2009-12-31"))].head(3))
+        st.dataframe(
+            df[df["sortie"].between("2009-06-01", "2009-12-31")].head(3))
 
 
     # WORD CLOUD OF 2000s MOVIES
@@ -386,31 +445,31 @@ if page == "2000s":
 
     col1, col2 = st.columns(2)
     with col1:
-        st.write(df_2000s[df_2000s["titre"].str.contains("SECRET")].sort_values("titre"))
+        st.dataframe(df_2000s[themes["2000s"]["SECRET"]].sort_values("titre"))
     with col2:
-        st.write(df_2000s[df_2000s["titre"].str.contains("JOUR")].sort_values("titre"))
+        st.dataframe(df_2000s[themes["2000s"]["JOUR"]].sort_values("titre"))
 
     col3, col4 = st.columns(2)
     with col3:
-        st.write(df_2000s[df_2000s["titre"].str.contains("VIE")].sort_values("titre"))
+        st.dataframe(df_2000s[themes["2000s"]["VIE"]].sort_values("titre"))
     with col4:
-        st.write(df_2000s[df_2000s["titre"].str.contains("MONDE")].sort_values("titre"))
+        st.dataframe(df_2000s[themes["2000s"]["MONDE"]].sort_values("titre"))
 
     st.markdown("There are also some **franchise's chapters** of movies in the 2000s:")
-    st.write(df_2000s[df_2000s["titre"].str.contains("CHAPITRE")].sort_values("titre"))
+    st.dataframe(df_2000s[themes["2000s"]["CHAPITRE"]].sort_values("titre"))
 
 
     # DISTRIBUTION OF 2000S NATIONALITIES
     st.markdown("""----------------------------------""")
     st.header("\nWhat are the countries' films that have made the most entries in France in the 2000s?")
-    plot_nationalites_distribution(df_2000s, "Nationalities of 2000s Millionaire Movies")
+    plot_nationalites_distribution(top_10_nat["2000s"], "Nationalities of 2000s Millionaire Movies")
 
     st.markdown("""
     Overall, United States and France trust the charts : **+500M tickets cumulated!**
     \nYet there is a significant part of popular **Great Britain** movies, with around **60M tickets**. :flag-gb:
     \nThis may be possible thanks to the popularity of the *Harry Potter* saga: 
     """)
-    st.write(df_2000s[df_2000s["nationalité"] == "GB"].head())
+    st.dataframe(df_2000s[df_2000s["nationalité"] == "GB"].head())
 
 
     # CULT MOVIES OF THE 2000s
@@ -454,7 +513,7 @@ if page == "2010s":
     st.toast("2010s Movies !", icon="🍿")
     st.title("2010's Millionaire Movies in France")
     st.write("A dataset of {} movies, ranked by number of entries: ".format(df_2010s.shape[0]))
-    st.write(df_2010s)
+    st.dataframe(df_2010s, height=400)
 
     st.header("We plot all these movies.")
     st.subheader("You can interact with the graph to focus on a specific region.")
@@ -471,7 +530,7 @@ if page == "2010s":
     with col1:
         plot_entrees_evolution(df_2010s, "Evolution of the entries through the years in the 2010s")
     with col2:
-        plot_nb_movies_evolution(df_2010s, 2010,
+        plot_nb_movies_evolution(year_counts.loc[2010:2019],
                                  "Number of movies that have made more than 1 million entries per year in the 2010s")
 
     st.markdown("""
@@ -484,14 +543,14 @@ if page == "2010s":
 
     col1, col2, col3 = st.columns(3)
     with col1:
-        st.write(
-            df[(df["sortie"] >= pd.to_datetime("2011-06-01")) & (df["sortie"] <= pd.to_datetime("2011-12-31"))].head(3))
+        st.dataframe(
+            df[df["sortie"].between("2011-06-01", "2011-12-31")].head(3))
     with col2:
-        st.write(
-            df[(df["sortie"] >= pd.to_datetime("2013-01-01")) & (df["sortie"] <= pd.to_datetime("2013-12-31"))].head(3))
+        st.dataframe(
+            df[df["sortie"].between("2013-01-01", "2013-12-31")].head(3))
     with col3:
-        st.write(
-            df[(df["sortie"] >= pd.to_datetime("2014-01-01")) & (df["sortie"] <= pd.to_datetime("2014-12-31"))].head(3))
+        st.dataframe(
+            df[df["sortie"].between("2014-01-01", "2014-12-31")].head(3))
 
 
     # WORD CLOUD OF 2010s MOVIES
@@ -511,42 +570,42 @@ if page == "2010s":
 
     col1, col2, col3 = st.columns(3)
     with col1:
-        st.write(df_2010s[df_2010s["titre"].str.contains("MONDE")].sort_values("titre"))
+        st.dataframe(df_2010s[themes["2010s"]["MONDE"]].sort_values("titre"))
     with col2:
-        st.write(df_2010s[df_2010s["titre"].str.contains("AVENTURE")].sort_values("titre"))
+        st.dataframe(df_2010s[themes["2010s"]["AVENTURE"]].sort_values("titre"))
     with col3:
-        st.write(df_2010s[df_2010s["titre"].str.contains("VOYAGE")].sort_values("titre"))
+        st.dataframe(df_2010s[themes["2010s"]["VOYAGE"]].sort_values("titre"))
 
     col4, col5 = st.columns(2)
     with col4:
-        st.write(df_2010s[df_2010s["titre"].str.contains("DERNIER")].sort_values("titre"))
+        st.dataframe(df_2010s[themes["2010s"]["DERNIER"]].sort_values("titre"))
     with col5:
-        st.write(df_2010s[df_2010s["titre"].str.contains("SECR")].sort_values("titre"))
+        st.dataframe(df_2010s[themes["2010s"]["SECR"]].sort_values("titre"))
 
     st.markdown("""
     \nLike in the 2000s, there are also some **franchise's chapters** of movies in the 2010s:
     """)
-    st.write(df_2010s[df_2010s["titre"].str.contains("CHAPITRE")].sort_values("titre"))
+    st.dataframe(df_2010s[themes["2010s"]["CHAPITRE"]].sort_values("titre"))
     st.markdown("We can notice here that the *Narnia* and *Twilight* sagas are continuing in the 2010s.")
 
 
     # DISTRIBUTION OF 2010S NATIONALITIES
     st.markdown("""----------------------------------""")
     st.header("\nWhat are the countries' films that have made the most entries in France in the 2010s?")
-    plot_nationalites_distribution(df_2010s, "Nationalities of 2010s Millionaire Movies")
+    plot_nationalites_distribution(top_10_nat["2010s"], "Nationalities of 2010s Millionaire Movies")
 
     st.markdown("""
     Again, the vast majority of entries are performed by **American & French** movies (almost **1B** tickets 
     cumulated! :exploding_head:).
     \nStill **British** movies perfoms well with **89M** entries, thanks to the *Harry Potter* & *James Bond saga* :flag-gb:
     """)
-    st.write(df_2010s[df_2010s["nationalité"] == "GB"].head())
+    st.dataframe(df_2010s[df_2010s["nationalité"] == "GB"].head())
 
     st.markdown("""
     Moreover, there is a quite significant part of **Franco-Belgian** movies, cumulating more than **56M** entries.
     These movies are mainly *comedies* co-produced by the two countries. :flag-be:
     """)
-    st.write(df_2010s[df_2010s["nationalité"] == "FR / BE"].head())
+    st.dataframe(df_2010s[df_2010s["nationalité"] == "FR / BE"].head())
 
 
     # CULT MOVIES OF THE 2010s
@@ -593,7 +652,7 @@ if page == "2020s":
     st.toast("2020s Movies !", icon="🍿")
     st.title("2020's Millionaire Movies in France")
     st.write("A dataset of {} movies, ranked by number of entries: ".format(df_2020s.shape[0]))
-    st.write(df_2020s)
+    st.dataframe(df_2020s, height=400)
 
     st.warning("""
     :warning: This analysis was performed in *October 2023*, with only 3 years of data.
@@ -615,7 +674,7 @@ if page == "2020s":
     with col1:
         plot_entrees_evolution(df_2020s, "Evolution of the entries through the years in the 2020s")
     with col2:
-        plot_nb_movies_evolution(df_2020s, 2020,
+        plot_nb_movies_evolution(year_counts.loc[2020:],
                                  "Number of movies that have made more than 1 million entries per year in the 2020s")
 
     st.markdown("""
@@ -652,23 +711,23 @@ if page == "2020s":
     """)
     col1, col2, col3 = st.columns(3)
     with col1:
-        st.write(df_2020s[df_2020s["titre"].str.contains("BLACK")].sort_values("titre"))
+        st.dataframe(df_2020s[themes["2020s"]["BLACK"]].sort_values("titre"))
     with col2:
-        st.write(df_2020s[df_2020s["titre"].str.contains("ANIMAUX")].sort_values("titre"))
+        st.dataframe(df_2020s[themes["2020s"]["ANIMAUX"]].sort_values("titre"))
     with col3:
-        st.write(df_2020s[df_2020s["titre"].str.contains("FANTASTIQUE")].sort_values("titre"))
+        st.dataframe(df_2020s[themes["2020s"]["FANTASTIQUE"]].sort_values("titre"))
 
     col4, col5 = st.columns(2)
     with col4:
-        st.write(df_2020s[df_2020s["titre"].str.contains("VOYAGE")].sort_values("titre"))
+        st.dataframe(df_2020s[themes["2020s"]["VOYAGE"]].sort_values("titre"))
     with col5:
-        st.write(df_2020s[df_2020s["titre"].str.contains("JOUR")].sort_values("titre"))
+        st.dataframe(df_2020s[themes["2020s"]["JOUR"]].sort_values("titre"))
 
 
     # DISTRIBUTION OF 2020S NATIONALITIES
     st.markdown("""----------------------------------""")
     st.header("\nWhat are the countries' films that have made the most entries in France in the 2020s?")
-    plot_nationalites_distribution(df_2020s, "Nationalities of 2020s Millionaire Movies")
+    plot_nationalites_distribution(top_10_nat["2020s"], "Nationalities of 2020s Millionaire Movies")
 
     st.markdown("""
     At the time of the analysis (10/2023, 3 years of data), **France & the United States** are once again
@@ -677,7 +736,7 @@ if page == "2020s":
     6 millionaire movies**! This is possible thanks to well-known sagas *(James Bond, Jurassic World, Batman)*
     as well as **Christopher Nolan**'s films (*Tenet*, and certainly *Oppenheimer* for 2023). :flag-gb:
     """)
-    st.write(df_2020s[df_2020s["nationalité"] == "GB"])
+    st.dataframe(df_2020s[df_2020s["nationalité"] == "GB"])
 
 
     # CULT MOVIES OF THE 2020s
@@ -695,7 +754,7 @@ if page == "2020s":
         st.video("https://youtu.be/G_peA3q3Q9w?si=pFcNWAJPnhGQDEYr")
 
     st.subheader("International Movies :earth_africa:")
-    st.write(df_2020s[df_2020s["nationalité"] == "US"])
+    st.dataframe(df_2020s[df_2020s["nationalité"] == "US"])
 
     col1, col2, col3 = st.columns(3)
     with col1: